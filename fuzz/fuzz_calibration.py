@@ -2,7 +2,7 @@
 """
 LibFuzzer harness for calibration JSON (Calibration.from_dict).
 
-Feed raw bytes as JSON. Fuzzer exercises from_dict and _to_triple with arbitrary JSON.
+Feed raw bytes as JSON. Exercises from_dict and coerce_triple with arbitrary JSON.
 Run: python fuzz/fuzz_calibration.py fuzz/corpus/calibration/ [options]
 """
 
@@ -22,12 +22,8 @@ with atheris.instrument_imports():
 def test_one_input(data: bytes) -> None:
     """Single fuzz iteration: parse JSON and build Calibration."""
     try:
-        text = data.decode("utf-8")
-    except UnicodeDecodeError:
-        return
-    try:
-        obj = json.loads(text)
-    except json.JSONDecodeError:
+        obj = json.loads(data)
+    except ValueError:
         return
     cal = Calibration.from_dict(obj)
     cal.apply_gyro((0.0, 0.0, 0.0))
@@ -6,7 +6,6 @@ Feed raw bytes as JSON. Fuzzer exercises API request parsing and validation.
 Run: python fuzz/fuzz_calibration_api.py fuzz/corpus/calibration_api/ [options]
 """
 
-import json
 import sys
 
 try:
@@ -18,21 +17,19 @@ except ImportError:
 with atheris.instrument_imports():
     from navit_daemon.calibration import Calibration
     from navit_daemon.calibration_api import CalibrationManager, _handle_request
+    from navit_daemon.jsonutil import loads
+
+_MANAGER = CalibrationManager(Calibration())
 
 
 def test_one_input(data: bytes) -> None:
     """Single fuzz iteration: parse JSON and handle as calibration API request."""
     try:
-        text = data.decode("utf-8")
-    except UnicodeDecodeError:
-        return
-    try:
-        request = json.loads(text)
-    except json.JSONDecodeError:
+        request = loads(data)
+    except ValueError:
         return
-    cal = Calibration()
-    manager = CalibrationManager(cal)
-    _handle_request(manager, None, request, 100.0)
+    _MANAGER.reset()
+    _handle_request(_MANAGER, None, request, 100.0)
 
 
 def main() -> None:
@@ -19,16 +19,14 @@ except ImportError:
 with atheris.instrument_imports():
     from navit_daemon.nmea import build_gga, build_rmc
 
+_NUM = (int, float)
+
 
 def test_one_input(data: bytes) -> None:
     """Single fuzz iteration: parse JSON and build NMEA sentences."""
     try:
-        text = data.decode("utf-8")
-    except UnicodeDecodeError:
-        return
-    try:
-        obj = json.loads(text)
-    except json.JSONDecodeError:
+        obj = json.loads(data)
+    except ValueError:
         return
     if not isinstance(obj, dict):
         return
@@ -44,15 +42,20 @@ def test_one_input(data: bytes) -> None:
     date_iso = obj.get("date_iso")
     if date_iso is not None and not isinstance(date_iso, str):
         date_iso = None
+    speed_v = obj.get("speed", 0)
+    track_v = obj.get("track", 0)
+    quality_v = obj.get("fix_quality", 1)
+    sats_v = obj.get("num_sats", 0)
+    hdop_v = obj.get("hdop", 1.0)
     try:
-        speed = float(obj.get("speed", 0)) if isinstance(obj.get("speed"), (int, float)) else 0.0
-        track = float(obj.get("track", 0)) if isinstance(obj.get("track"), (int, float)) else 0.0
+        speed = float(speed_v) if isinstance(speed_v, _NUM) else 0.0
+        track = float(track_v) if isinstance(track_v, _NUM) else 0.0
     except (TypeError, ValueError, OverflowError):
         speed, track = 0.0, 0.0
     try:
-        fix_quality = int(obj.get("fix_quality", 1)) if isinstance(obj.get("fix_quality"), (int, float)) else 1
-        num_sats = int(obj.get("num_sats", 0)) if isinstance(obj.get("num_sats"), (int, float)) else 0
-        hdop = float(obj.get("hdop", 1.0)) if isinstance(obj.get("hdop"), (int, float)) else 1.0
+        fix_quality = int(quality_v) if isinstance(quality_v, _NUM) else 1
+        num_sats = int(sats_v) if isinstance(sats_v, _NUM) else 0
+        hdop = float(hdop_v) if isinstance(hdop_v, _NUM) else 1.0
     except (TypeError, ValueError, OverflowError):
         fix_quality, num_sats, hdop = 1, 0, 1.0
     valid = bool(obj.get("valid", True))
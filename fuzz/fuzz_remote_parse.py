@@ -21,7 +21,7 @@ with atheris.instrument_imports():
 def test_one_input(data: bytes) -> None:
     """Single fuzz iteration: decode data as UTF-8 and parse as remote protocol line."""
     try:
-        line = data.decode("utf-8").strip()
+        line = data.strip().decode("utf-8")
     except UnicodeDecodeError:
         return
     source = RemoteSource(host="127.0.0.1", port=0)
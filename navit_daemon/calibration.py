@@ -9,22 +9,21 @@ Units: gyro_bias deg/s, accel_offset m/s^2, magnetometer_bias microtesla (uT).
 
 import json
 import logging
+import os
 from pathlib import Path
 from typing import Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
 
-def _to_triple(
-    value: object, default: Tuple[float, float, float]
-) -> Tuple[float, float, float]:
-    """Convert list of 3 numbers to tuple; else return default."""
-    if isinstance(value, (list, tuple)) and len(value) >= 3:
-        try:
-            return (float(value[0]), float(value[1]), float(value[2]))
-        except (TypeError, ValueError):
-            pass
-    return default
+def coerce_triple(value: object) -> Optional[Tuple[float, float, float]]:
+    """Convert a list/tuple of at least 3 numbers to a float triple, else None."""
+    if not isinstance(value, (list, tuple)) or len(value) < 3:
+        return None
+    try:
+        return (float(value[0]), float(value[1]), float(value[2]))
+    except (TypeError, ValueError, OverflowError):
+        return None
 
 
 class Calibration:
@@ -94,33 +93,58 @@ class Calibration:
         if not isinstance(data, dict):
             return cls()
         return cls(
-            gyro_bias=_to_triple(data.get("gyro_bias"), (0.0, 0.0, 0.0)),
-            accel_offset=_to_triple(data.get("accel_offset"), (0.0, 0.0, 0.0)),
-            magnetometer_bias=_to_triple(
-                data.get("magnetometer_bias"), (0.0, 0.0, 0.0)
-            ),
+            gyro_bias=coerce_triple(data.get("gyro_bias")),
+            accel_offset=coerce_triple(data.get("accel_offset")),
+            magnetometer_bias=coerce_triple(data.get("magnetometer_bias")),
         )
 
 
 def load_calibration(path: Optional[Path]) -> Calibration:
     """Load calibration from a JSON file. Missing/invalid file returns default."""
-    if not path or not path.exists():
+    if not path:
         return Calibration()
     try:
         text = path.read_text()
         data = json.loads(text)
         return Calibration.from_dict(data)
+    except FileNotFoundError:
+        return Calibration()
     except (OSError, json.JSONDecodeError) as e:
         logger.warning("Calibration load failed %s: %s", path, e)
         return Calibration()
 
 
+def _write_synced(path: Path, text: str) -> None:
+    """Write text to path and fsync it, so the data is on disk before a rename."""
+    with open(path, "w") as f:
+        f.write(text)
+        f.flush()
+        os.fsync(f.fileno())
+
+
 def save_calibration(path: Path, calibration: Calibration) -> bool:
-    """Write calibration to JSON file. Returns True on success."""
+    """
+    Write calibration to JSON file. Returns True on success.
+
+    The JSON is written and fsync'd to a sibling temporary file, then renamed
+    over path, so a crash or power cut mid-save leaves either the old or the
+    new file, never a truncated one. The parent directory is only created
+    when the first write attempt finds it missing.
+    """
+    text = json.dumps(calibration.to_dict(), indent=2) + "\n"
+    tmp_path = path.with_name(path.name + ".tmp")
     try:
-        path.parent.mkdir(parents=True, exist_ok=True)
-        path.write_text(json.dumps(calibration.to_dict(), indent=2) + "\n")
+        try:
+            _write_synced(tmp_path, text)
+        except FileNotFoundError:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            _write_synced(tmp_path, text)
+        os.replace(tmp_path, path)
         return True
     except OSError as e:
         logger.warning("Calibration save failed %s: %s", path, e)
+        try:
+            tmp_path.unlink()
+        except OSError:
+            pass
         return False
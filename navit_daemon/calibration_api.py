@@ -8,14 +8,16 @@ Protocol: one JSON object per line.
 Main loop feeds gyro via manager.add_gyro_sample(gyro).
 """
 
-import json
 import logging
+import math
+import selectors
 import socket
 import threading
 from pathlib import Path
-from typing import Callable, List, Optional, Tuple
+from typing import Callable, Optional, Tuple
 
-from navit_daemon.calibration import Calibration, save_calibration
+from navit_daemon.calibration import Calibration, coerce_triple, save_calibration
+from navit_daemon.jsonutil import dumps, loads
 
 logger = logging.getLogger(__name__)
 
@@ -26,7 +28,8 @@ class CalibrationManager:
 
     When calibrate_gyro(seconds) is called, the main loop should call
     add_gyro_sample(gyro) each cycle; after enough samples the mean is
-    set as gyro_bias and collection stops.
+    set as gyro_bias and collection stops. Samples are folded into running
+    per-axis sums, so collection is O(1) per sample with no buffer growth.
     """
 
     def __init__(
@@ -37,8 +40,21 @@ class CalibrationManager:
         self._calibration = calibration
         self._save_path = save_path
         self._lock = threading.Lock()
-        self._gyro_samples: List[Tuple[float, float, float]] = []
+        self._gyro_sum = [0.0, 0.0, 0.0]
+        self._samples_collected = 0
         self._samples_needed = 0
+        # (path, gyro_bias, accel_offset, magnetometer_bias) of the last
+        # successful save; None until one succeeds or after one fails.
+        self._last_saved: Optional[tuple] = None
+
+    def reset(self) -> None:
+        """Zero the calibration and drop any gyro collection or save record."""
+        with self._lock:
+            self._set_locked((0.0, 0.0, 0.0), (0.0, 0.0, 0.0), (0.0, 0.0, 0.0))
+            self._gyro_sum = [0.0, 0.0, 0.0]
+            self._samples_collected = 0
+            self._samples_needed = 0
+            self._last_saved = None
 
     def get_calibration(self) -> Calibration:
         return self._calibration
@@ -50,12 +66,50 @@ class CalibrationManager:
         magnetometer_bias: Optional[Tuple[float, float, float]] = None,
     ) -> None:
         with self._lock:
-            if gyro_bias is not None:
-                self._calibration.gyro_bias = gyro_bias
-            if accel_offset is not None:
-                self._calibration.accel_offset = accel_offset
-            if magnetometer_bias is not None:
-                self._calibration.magnetometer_bias = magnetometer_bias
+            self._set_locked(gyro_bias, accel_offset, magnetometer_bias)
+
+    def set_and_save(
+        self,
+        save_path: Optional[Path],
+        gyro_bias: Optional[Tuple[float, float, float]] = None,
+        accel_offset: Optional[Tuple[float, float, float]] = None,
+        magnetometer_bias: Optional[Tuple[float, float, float]] = None,
+    ) -> bool:
+        """
+        Set calibration values and write the result to save_path (if set).
+
+        The write is skipped when the result matches the last successful save
+        to save_path, so clients that resend full state every tick do not
+        rewrite the file; a failed save is retried on the next call.
+        Returns False only if a save was attempted and failed.
+        """
+        with self._lock:
+            self._set_locked(gyro_bias, accel_offset, magnetometer_bias)
+            if not save_path:
+                return True
+            return self._save_locked(save_path)
+
+    def _set_locked(
+        self,
+        gyro_bias: Optional[Tuple[float, float, float]],
+        accel_offset: Optional[Tuple[float, float, float]],
+        magnetometer_bias: Optional[Tuple[float, float, float]],
+    ) -> None:
+        if gyro_bias is not None:
+            self._calibration.gyro_bias = gyro_bias
+        if accel_offset is not None:
+            self._calibration.accel_offset = accel_offset
+        if magnetometer_bias is not None:
+            self._calibration.magnetometer_bias = magnetometer_bias
+
+    def _save_locked(self, path: Path) -> bool:
+        cal = self._calibration
+        state = (path, cal.gyro_bias, cal.accel_offset, cal.magnetometer_bias)
+        if state == self._last_saved:
+            return True
+        ok = save_calibration(path, cal)
+        self._last_saved = state if ok else None
+        return ok
 
     def start_gyro_calibration(self, seconds: float, sample_rate_hz: float) -> int:
         """
@@ -65,7 +119,8 @@ class CalibrationManager:
         until done).
         """
         with self._lock:
-            self._gyro_samples = []
+            self._gyro_sum = [0.0, 0.0, 0.0]
+            self._samples_collected = 0
             self._samples_needed = max(1, int(seconds * sample_rate_hz))
             return self._samples_needed
 
@@ -75,17 +130,26 @@ class CalibrationManager:
 
         Returns True if calibration was just finished (bias updated).
         """
+        # Unlocked fast path for the common idle case (called every IMU cycle).
+        # A racing start_gyro_calibration only costs a sample at the boundary.
+        if self._samples_needed <= 0:
+            return False
         with self._lock:
             if self._samples_needed <= 0:
                 return False
-            self._gyro_samples.append(gyro)
-            if len(self._gyro_samples) >= self._samples_needed:
-                n = len(self._gyro_samples)
-                bx = sum(s[0] for s in self._gyro_samples) / n
-                by = sum(s[1] for s in self._gyro_samples) / n
-                bz = sum(s[2] for s in self._gyro_samples) / n
+            acc = self._gyro_sum
+            acc[0] += gyro[0]
+            acc[1] += gyro[1]
+            acc[2] += gyro[2]
+            self._samples_collected += 1
+            if self._samples_collected >= self._samples_needed:
+                n = self._samples_collected
+                bx = acc[0] / n
+                by = acc[1] / n
+                bz = acc[2] / n
                 self._calibration.gyro_bias = (bx, by, bz)
-                self._gyro_samples = []
+                self._gyro_sum = [0.0, 0.0, 0.0]
+                self._samples_collected = 0
                 self._samples_needed = 0
                 logger.info(
                     "Gyro calibration done: bias=(%.4f, %.4f, %.4f) deg/s",
@@ -94,7 +158,7 @@ class CalibrationManager:
                     bz,
                 )
                 if self._save_path:
-                    save_calibration(self._save_path, self._calibration)
+                    self._save_locked(self._save_path)
                 return True
             return False
 
@@ -107,12 +171,78 @@ class CalibrationManager:
                 "accel_offset": list(self._calibration.accel_offset),
                 "magnetometer_bias": list(self._calibration.magnetometer_bias),
                 "calibration_status": status,
-                "samples_collected": len(self._gyro_samples),
+                "samples_collected": self._samples_collected,
                 "samples_needed": self._samples_needed,
             }
 
 
-def _handle_request(  # noqa: C901
+_TRIPLE_KEYS = ("gyro_bias", "accel_offset", "magnetometer_bias")
+
+
+def _handle_get_calibration(
+    manager: CalibrationManager,
+    save_path: Optional[Path],
+    value: object,
+    sample_rate_hz: float,
+) -> Optional[dict]:
+    """Return current status; a falsy flag is not treated as a request."""
+    if not value:
+        return None
+    return manager.get_status()
+
+
+def _handle_set_calibration(
+    manager: CalibrationManager,
+    save_path: Optional[Path],
+    set_cal: object,
+    sample_rate_hz: float,
+) -> Optional[dict]:
+    """Validate and apply a set_calibration object; save when save_path is set."""
+    if not isinstance(set_cal, dict):
+        return {"error": "set_calibration must be an object"}
+    coerced = {}
+    for key in _TRIPLE_KEYS:
+        value = set_cal.get(key)
+        if value is None:
+            continue
+        triple = coerce_triple(value)
+        if triple is None:
+            return {"error": f"{key} must be [x,y,z]"}
+        if not all(math.isfinite(v) for v in triple):
+            return {"error": f"{key} must be finite"}
+        coerced[key] = triple
+    manager.set_and_save(save_path, **coerced)
+    return {"ok": True}
+
+
+def _handle_calibrate_gyro(
+    manager: CalibrationManager,
+    save_path: Optional[Path],
+    cal_gyro: object,
+    sample_rate_hz: float,
+) -> Optional[dict]:
+    """Start gyro bias collection for the requested (clamped) duration."""
+    if not isinstance(cal_gyro, dict):
+        return {"error": "calibrate_gyro must be an object"}
+    seconds = float(cal_gyro.get("seconds", 5.0))
+    seconds = max(0.5, min(60.0, seconds))
+    needed = manager.start_gyro_calibration(seconds, sample_rate_hz)
+    return {"status": "collecting", "samples_needed": needed}
+
+
+_RequestHandler = Callable[
+    [CalibrationManager, Optional[Path], object, float], Optional[dict]
+]
+
+# Request keys in precedence order; the first key present (and handled) wins.
+_DISPATCH: Tuple[Tuple[str, _RequestHandler], ...] = (
+    ("get_calibration", _handle_get_calibration),
+    ("set_calibration", _handle_set_calibration),
+    ("calibrate_gyro", _handle_calibrate_gyro),
+)
+
+
+def _handle_request(
     manager: CalibrationManager,
     save_path: Optional[Path],
     request: dict,
@@ -121,68 +251,52 @@ def _handle_request(  # noqa: C901
     """Process one API request; return response dict."""
     if not isinstance(request, dict):
         return {"error": "invalid request"}
+    for key, handler in _DISPATCH:
+        value = request.get(key)
+        if value is None:
+            continue
+        response = handler(manager, save_path, value, sample_rate_hz)
+        if response is not None:
+            return response
+    return {"error": "unknown request"}
 
-    if request.get("get_calibration"):
-        return manager.get_status()
 
-    set_cal = request.get("set_calibration")
-    if set_cal is not None:
-        if not isinstance(set_cal, dict):
-            return {"error": "set_calibration must be an object"}
-        gyro_bias = set_cal.get("gyro_bias")
-        accel_offset = set_cal.get("accel_offset")
-        magnetometer_bias = set_cal.get("magnetometer_bias")
-        if gyro_bias is not None:
-            if not isinstance(gyro_bias, (list, tuple)) or len(gyro_bias) < 3:
-                return {"error": "gyro_bias must be [x,y,z]"}
-            try:
-                gyro_bias = (float(gyro_bias[0]), float(gyro_bias[1]), float(gyro_bias[2]))
-            except (TypeError, ValueError):
-                return {"error": "gyro_bias must be [x,y,z]"}
-        if accel_offset is not None:
-            if not isinstance(accel_offset, (list, tuple)) or len(accel_offset) < 3:
-                return {"error": "accel_offset must be [x,y,z]"}
-            try:
-                accel_offset = (
-                    float(accel_offset[0]),
-                    float(accel_offset[1]),
-                    float(accel_offset[2]),
-                )
-            except (TypeError, ValueError):
-                return {"error": "accel_offset must be [x,y,z]"}
-        if magnetometer_bias is not None:
-            if (
-                not isinstance(magnetometer_bias, (list, tuple))
-                or len(magnetometer_bias) < 3
-            ):
-                return {"error": "magnetometer_bias must be [x,y,z]"}
-            try:
-                magnetometer_bias = (
-                    float(magnetometer_bias[0]),
-                    float(magnetometer_bias[1]),
-                    float(magnetometer_bias[2]),
-                )
-            except (TypeError, ValueError):
-                return {"error": "magnetometer_bias must be [x,y,z]"}
-        manager.set_calibration(
-            gyro_bias=gyro_bias,
-            accel_offset=accel_offset,
-            magnetometer_bias=magnetometer_bias,
-        )
-        if save_path:
-            save_calibration(save_path, manager.get_calibration())
-        return {"ok": True}
-
-    cal_gyro = request.get("calibrate_gyro")
-    if cal_gyro is not None:
-        if not isinstance(cal_gyro, dict):
-            return {"error": "calibrate_gyro must be an object"}
-        seconds = float(cal_gyro.get("seconds", 5.0))
-        seconds = max(0.5, min(60.0, seconds))
-        needed = manager.start_gyro_calibration(seconds, sample_rate_hz)
-        return {"status": "collecting", "samples_needed": needed}
+def _serve_client(
+    client: socket.socket,
+    manager: CalibrationManager,
+    save_path: Optional[Path],
+    sample_rate_hz: float,
+    shutdown: Callable[[], bool],
+) -> None:
+    """
+    Answer newline-delimited JSON requests on one client socket until EOF.
 
-    return {"error": "unknown request"}
+    Every complete line received in one recv() is handled, and the responses
+    for that batch are sent back with a single sendall(), so pipelined
+    requests cost one read and one write syscall per batch.
+    """
+    pending = b""
+    while not shutdown():
+        chunk = client.recv(4096)
+        if not chunk:
+            break
+        lines = (pending + chunk).split(b"\n")
+        pending = lines.pop()
+        out = []
+        for line in lines:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                request = loads(line)
+            except ValueError:
+                response = {"error": "invalid JSON"}
+            else:
+                response = _handle_request(manager, save_path, request, sample_rate_hz)
+            out.append(dumps(response))
+        if out:
+            out.append(b"")
+            client.sendall(b"\n".join(out))
 
 
 def run_calibration_server(  # noqa: C901
@@ -197,7 +311,7 @@ def run_calibration_server(  # noqa: C901
     Run TCP server that handles calibration API until shutdown() returns True.
 
     Call from a dedicated thread. Each client connection: one JSON line in,
-    one JSON line out per request.
+    one JSON line out per request (see _serve_client).
     """
     sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
     sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
@@ -207,44 +321,33 @@ def run_calibration_server(  # noqa: C901
         logger.error("Calibration API bind failed %s:%s: %s", host, port, e)
         return
     sock.listen(1)
-    sock.settimeout(1.0)
+    sock.setblocking(False)
     logger.info("Calibration API on %s:%s", host, port)
 
-    while not shutdown():
-        try:
-            client, addr = sock.accept()
-        except socket.timeout:
-            continue
-        except OSError:
-            if shutdown():
-                break
-            continue
-        try:
-            client.settimeout(10.0)
-            with client.makefile(mode="rw", encoding="utf-8") as f:
-                for line in f:
-                    if shutdown():
-                        break
-                    line = line.strip()
-                    if not line:
-                        continue
-                    try:
-                        request = json.loads(line)
-                    except json.JSONDecodeError:
-                        response = {"error": "invalid JSON"}
-                    else:
-                        response = _handle_request(
-                            manager, save_path, request, sample_rate_hz
-                        )
-                    f.write(json.dumps(response) + "\n")
-                    f.flush()
-        except (ConnectionResetError, BrokenPipeError, OSError) as e:
-            logger.debug("Calibration API client error: %s", e)
-        finally:
+    # Wait for connections with a selector rather than an accept() timeout,
+    # so an idle server does not raise socket.timeout once per second.
+    with selectors.DefaultSelector() as sel:
+        sel.register(sock, selectors.EVENT_READ)
+        while not shutdown():
+            if not sel.select(1.0):
+                continue
             try:
-                client.close()
+                client, addr = sock.accept()
             except OSError:
-                pass
+                if shutdown():
+                    break
+                continue
+            try:
+                client.settimeout(10.0)
+                client.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+                _serve_client(client, manager, save_path, sample_rate_hz, shutdown)
+            except (ConnectionResetError, BrokenPipeError, OSError) as e:
+                logger.debug("Calibration API client error: %s", e)
+            finally:
+                try:
+                    client.close()
+                except OSError:
+                    pass
 
     try:
         sock.close()
@@ -4,6 +4,7 @@ Configuration defaults and parsing for navit-daemon.
 
 import argparse
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Optional
 
 
@@ -29,8 +30,9 @@ class Config:
     debug: bool = False
 
 
-def parse_args(args: Optional[list] = None) -> Config:
-    """Parse command-line arguments into Config."""
+@lru_cache(maxsize=1)
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the argument parser once; parse_args() reuses it."""
     parser = argparse.ArgumentParser(
         description="Fuse GPS (gpsd) and IMU (IIO) for Navit; output NMEA with heading."
     )
@@ -122,7 +124,12 @@ def parse_args(args: Optional[list] = None) -> Config:
         action="store_true",
         help="Enable debug logging",
     )
-    parsed = parser.parse_args(args)
+    return parser
+
+
+def parse_args(args: Optional[list] = None) -> Config:
+    """Parse command-line arguments into Config."""
+    parsed = _build_parser().parse_args(args)
     return Config(
         source=parsed.source,
         gpsd_host=parsed.gpsd_host,
@@ -4,6 +4,7 @@ GPS position and velocity from gpsd.
 
 import logging
 from dataclasses import dataclass
+from datetime import datetime, timezone
 from typing import Optional
 
 logger = logging.getLogger(__name__)
@@ -71,12 +72,12 @@ def get_current_fix(gpsd_module: Optional[object]) -> Optional[GpsFix]:  # noqa:
         time_iso = None
         if hasattr(packet, "time") and packet.time:
             try:
-                from datetime import datetime
-
                 t = packet.time
                 if isinstance(t, (int, float)):
-                    time_iso = datetime.utcfromtimestamp(t).strftime(
-                        "%Y-%m-%dT%H:%M:%SZ"
+                    time_iso = (
+                        datetime.fromtimestamp(t, tz=timezone.utc)
+                        .isoformat(timespec="seconds")
+                        .replace("+00:00", "Z")
                     )
                 else:
                     time_iso = str(t)
@@ -14,6 +14,7 @@ Supports common Raspberry Pi IMUs:
 """
 
 import logging
+import os
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
@@ -64,6 +65,30 @@ def _read_one(path: Path, default: float = 0.0) -> float:
         return default
 
 
+def _open_raw_channels(
+    device_path: Path, prefix: str
+) -> Optional[Tuple[int, int, int]]:
+    """Open the x, y, z raw attributes for repeated pread(); None on error."""
+    fds: List[int] = []
+    try:
+        for axis in ("x", "y", "z"):
+            fds.append(os.open(device_path / f"{prefix}_{axis}_raw", os.O_RDONLY))
+    except OSError as e:
+        logger.debug("Cannot open %s raw channels in %s: %s", prefix, device_path, e)
+        for fd in fds:
+            os.close(fd)
+        return None
+    return (fds[0], fds[1], fds[2])
+
+
+def _pread_one(fd: int, default: float = 0.0) -> float:
+    """Re-read a sysfs value from offset 0 of an open fd; default on error."""
+    try:
+        return float(os.pread(fd, 32, 0))
+    except (OSError, ValueError):
+        return default
+
+
 def _read_string(path: Path, default: str = "") -> str:
     """Read a string value from sysfs; return default on error."""
     try:
@@ -138,7 +163,8 @@ def discover_iio_devices() -> List[Path]:
         return []
     devices = []
     for path in IIO_BASE.iterdir():
-        if path.is_dir() and path.name.startswith("iio:device"):
+        # Name check first: is_dir() stats (and follows the sysfs symlink).
+        if path.name.startswith("iio:device") and path.is_dir():
             devices.append(path)
     return sorted(devices, key=lambda p: p.name)
 
@@ -273,6 +299,10 @@ class IIOReader:
     Read accelerometer, gyroscope, and optionally magnetometer from IIO sysfs.
 
     Units: accelerometer m/s^2, gyroscope deg/s, magnetometer microtesla (uT).
+
+    The raw channel attributes are opened once and re-read with pread(), so a
+    sample costs three reads per sensor and no path lookups. Call close() to
+    release the file descriptors.
     """
 
     def __init__(
@@ -296,6 +326,41 @@ class IIOReader:
             self._read_gyro_calibration()
         if magnetometer_path:
             self._read_magnetometer_calibration()
+        self._accel_fds = (
+            _open_raw_channels(accel_path, "in_accel") if accel_path else None
+        )
+        self._gyro_fds = (
+            _open_raw_channels(gyro_path, "in_anglvel") if gyro_path else None
+        )
+        self._magnetometer_fds = (
+            _open_raw_channels(magnetometer_path, "in_magn")
+            if magnetometer_path
+            else None
+        )
+
+    def close(self) -> None:
+        """Close the raw channel file descriptors."""
+        for fds in (self._accel_fds, self._gyro_fds, self._magnetometer_fds):
+            if fds:
+                for fd in fds:
+                    try:
+                        os.close(fd)
+                    except OSError:
+                        pass
+        self._accel_fds = self._gyro_fds = self._magnetometer_fds = None
+
+    @staticmethod
+    def _read_raw(
+        fds: Optional[Tuple[int, int, int]], device_path: Path, prefix: str
+    ) -> Tuple[float, float, float]:
+        """Raw x, y, z from the cached fds, or by path if they could not be opened."""
+        if fds is not None:
+            return (_pread_one(fds[0]), _pread_one(fds[1]), _pread_one(fds[2]))
+        return (
+            _read_one(device_path / f"{prefix}_x_raw"),
+            _read_one(device_path / f"{prefix}_y_raw"),
+            _read_one(device_path / f"{prefix}_z_raw"),
+        )
 
     def _read_accel_calibration(self) -> None:
         """Load scale and optional offset for accelerometer."""
@@ -356,12 +421,9 @@ class IIOReader:
         """
         if not self.accel_path:
             return None
-        try:
-            raw_x = _read_one(self.accel_path / "in_accel_x_raw")
-            raw_y = _read_one(self.accel_path / "in_accel_y_raw")
-            raw_z = _read_one(self.accel_path / "in_accel_z_raw")
-        except OSError:
-            return None
+        raw_x, raw_y, raw_z = self._read_raw(
+            self._accel_fds, self.accel_path, "in_accel"
+        )
         x = (raw_x + self._accel_offset[0]) * self._accel_scale
         y = (raw_y + self._accel_offset[1]) * self._accel_scale
         z = (raw_z + self._accel_offset[2]) * self._accel_scale
@@ -375,12 +437,9 @@ class IIOReader:
         """
         if not self.gyro_path:
             return None
-        try:
-            raw_x = _read_one(self.gyro_path / "in_anglvel_x_raw")
-            raw_y = _read_one(self.gyro_path / "in_anglvel_y_raw")
-            raw_z = _read_one(self.gyro_path / "in_anglvel_z_raw")
-        except OSError:
-            return None
+        raw_x, raw_y, raw_z = self._read_raw(
+            self._gyro_fds, self.gyro_path, "in_anglvel"
+        )
         x = (raw_x + self._gyro_offset[0]) * self._gyro_scale
         y = (raw_y + self._gyro_offset[1]) * self._gyro_scale
         z = (raw_z + self._gyro_offset[2]) * self._gyro_scale
@@ -399,12 +458,9 @@ class IIOReader:
         """
         if not self.magnetometer_path:
             return None
-        try:
-            raw_x = _read_one(self.magnetometer_path / "in_magn_x_raw")
-            raw_y = _read_one(self.magnetometer_path / "in_magn_y_raw")
-            raw_z = _read_one(self.magnetometer_path / "in_magn_z_raw")
-        except OSError:
-            return None
+        raw_x, raw_y, raw_z = self._read_raw(
+            self._magnetometer_fds, self.magnetometer_path, "in_magn"
+        )
         x = (raw_x + self._magnetometer_offset[0]) * self._magnetometer_scale
         y = (raw_y + self._magnetometer_offset[1]) * self._magnetometer_scale
         z = (raw_z + self._magnetometer_offset[2]) * self._magnetometer_scale
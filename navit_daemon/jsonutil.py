@@ -0,0 +1,35 @@
+"""
+JSON line codec shared by the calibration API and the remote source.
+
+Uses orjson when installed (the "fast" extra) and stdlib json otherwise.
+Both reject NaN/Infinity literals on input and write compact UTF-8 output.
+"""
+
+import json
+from typing import Any, Union
+
+_orjson: Any = None
+try:
+    import orjson
+
+    _orjson = orjson
+except ImportError:
+    pass
+
+
+def _reject_constant(name: str) -> Any:
+    raise ValueError(f"{name} is not valid JSON")
+
+
+def loads(line: Union[bytes, str]) -> Any:
+    """Decode one line. Raises ValueError on invalid JSON."""
+    if _orjson is not None:
+        return _orjson.loads(line)
+    return json.loads(line, parse_constant=_reject_constant)
+
+
+def dumps(obj: Any) -> bytes:
+    """Encode obj as compact UTF-8 JSON (no trailing newline)."""
+    if _orjson is not None:
+        return _orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":")).encode("utf-8")
@@ -3,7 +3,6 @@ Main loop: fuse GPS and IMU from pluggable sources, output NMEA with AHRS headin
 """
 
 import logging
-import select
 import signal
 import sys
 import threading
@@ -32,6 +31,41 @@ def _signal_handler(signum: int, frame: Optional[object]) -> None:
     _shutdown = True
 
 
+def _run_imu_loop(imu_source: IMUSource, fusion: FusionAhrs, imu_dt: float) -> None:
+    """
+    Read the IMU and update fusion every imu_dt seconds until shutdown.
+
+    Runs on its own thread so slow sysfs reads cannot delay NMEA output; the
+    output loop only reads fusion.yaw_deg. The clock is sampled once per
+    pass: every deadline that has passed by then is served, and the thread
+    sleeps until the next one.
+    """
+    global _shutdown
+    # Bound once: this loop runs at imu_rate_hz for the daemon's lifetime.
+    read = imu_source.read
+    update = fusion.update
+    monotonic = time.monotonic
+    sleep = time.sleep
+    next_imu = monotonic() + imu_dt
+    try:
+        while not _shutdown:
+            now = monotonic()
+            while next_imu <= now and not _shutdown:
+                sample = read()
+                if sample:
+                    accel, gyro, magnetometer = sample
+                    update(accel, gyro, imu_dt, magnetometer=magnetometer)
+                next_imu += imu_dt
+            # Shutdown can cut a catch-up run short with next_imu still in
+            # the past; sleep() rejects negative lengths.
+            sleep(max(0.0, next_imu - now))
+    except Exception:
+        # Without IMU updates the heading would freeze while NMEA output
+        # carries on; stop the daemon so the service manager can restart it.
+        logger.exception("IMU loop failed, shutting down")
+        _shutdown = True
+
+
 def run(config: Config) -> int:  # noqa: C901
     """
     Run the daemon: IMU fusion + GPS, output NMEA on TCP.
@@ -137,32 +171,23 @@ def run(config: Config) -> int:  # noqa: C901
     imu_dt = 1.0 / config.imu_rate_hz
     output_interval = 1.0 / config.output_rate_hz
     last_output_time = 0.0
-    last_imu_time = time.monotonic()
     current_fix: Optional[GpsFix] = None
 
+    imu_thread = None
+    if imu_source:
+        imu_thread = threading.Thread(
+            target=_run_imu_loop,
+            args=(imu_source, fusion, imu_dt),
+            daemon=True,
+        )
+        imu_thread.start()
+
     try:
         while not _shutdown:
+            if server.wait_for_connection(min(output_interval, 0.1)):
+                server.accept_new()
             now = time.monotonic()
 
-            if server.get_socket():
-                r, _, _ = select.select(
-                    [server.get_socket()],
-                    [],
-                    [],
-                    min(imu_dt, output_interval, 0.1),
-                )
-                if r:
-                    server.accept_new()
-
-            while (time.monotonic() - last_imu_time) >= imu_dt and not _shutdown:
-                sample = imu_source.read() if imu_source else None
-                if sample:
-                    accel, gyro, magnetometer = sample
-                    fusion.update(accel, gyro, imu_dt, magnetometer=magnetometer)
-                last_imu_time += imu_dt
-            if last_imu_time < now:
-                last_imu_time = now
-
             if (now - last_output_time) >= output_interval:
                 last_output_time = now
                 if gps_source:
@@ -174,10 +199,7 @@ def run(config: Config) -> int:  # noqa: C901
                         heading,
                         time_iso=current_fix.time_iso,
                     )
-                    if gga:
-                        server.send_nmea(gga)
-                    if rmc:
-                        server.send_nmea(rmc)
+                    server.send_nmea_batch((gga, rmc))
 
     except KeyboardInterrupt:
         pass
@@ -185,6 +207,13 @@ def run(config: Config) -> int:  # noqa: C901
         server.stop()
         if remote_source:
             remote_source.stop()
+        if imu_thread:
+            imu_thread.join(timeout=2.0)
+        if imu_thread and imu_thread.is_alive():
+            # Closing now would pull the IIO fds out from under a read.
+            logger.warning("IMU thread did not stop; leaving IMU source open")
+        elif imu_source:
+            imu_source.close()
 
     return 0
 
@@ -2,19 +2,24 @@
 Build NMEA 0183 sentences (GGA, RMC) for Navit/gpsd.
 """
 
+import operator
+from functools import lru_cache, reduce
 from typing import Optional
 
 from navit_daemon.gps_reader import GpsFix
 
+_M_S_TO_KNOTS = 1.943844
+
 
 def _nmea_checksum(s: str) -> str:
     """Compute NMEA checksum (xor of bytes between $ and *)."""
-    c = 0
-    for ch in s:
-        c ^= ord(ch)
-    return f"{c:02X}"
+    # Encode as the output server does, so the checksum matches the bytes sent.
+    return f"{reduce(operator.xor, s.encode('ascii', 'replace'), 0):02X}"
 
 
+# Position and time fragments repeat between output ticks while the vehicle is
+# stationary (or within one second), so the formatted strings are memoised.
+@lru_cache(maxsize=64)
 def _lat_nmea(lat: float) -> str:
     """Format latitude as NMEA (DDDMM.MMMM,N/S)."""
     abs_lat = abs(lat)
@@ -24,6 +29,7 @@ def _lat_nmea(lat: float) -> str:
     return f"{deg:02d}{minutes:07.4f},{hem}"
 
 
+@lru_cache(maxsize=64)
 def _lon_nmea(lon: float) -> str:
     """Format longitude as NMEA (DDDMM.MMMM,E/W)."""
     abs_lon = abs(lon)
@@ -33,6 +39,7 @@ def _lon_nmea(lon: float) -> str:
     return f"{deg:03d}{minutes:07.4f},{hem}"
 
 
+@lru_cache(maxsize=16)
 def _time_iso_to_nmea(iso_str: Optional[str]) -> str:
     """Convert ISO8601 time to NMEA time (HHMMSS.ss)."""
     if not iso_str or "T" not in iso_str:
@@ -123,7 +130,7 @@ def fix_to_nmea(
         return (None, None)
     t_iso = time_iso if time_iso is not None else getattr(fix, "time_iso", None)
     lat, lon, alt = fix.lat, fix.lon, fix.alt
-    speed_knots = fix.speed_ms * 1.943844  # m/s to knots
+    speed_knots = fix.speed_ms * _M_S_TO_KNOTS
     track = heading_deg
     if fix.speed_ms > 0.5:
         track = fix.track
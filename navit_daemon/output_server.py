@@ -3,25 +3,34 @@ TCP server that streams NMEA sentences to clients (e.g. gpsd or Navit).
 """
 
 import logging
+import selectors
 import socket
 import threading
-from typing import List, Optional
+from typing import Dict, Iterable, List, Optional
 
 logger = logging.getLogger(__name__)
 
+# Unsent bytes allowed per client before it is considered stuck and dropped.
+MAX_PENDING_BYTES = 64 * 1024
+
 
 class NmeaTcpServer:
     """
     Simple TCP server that sends NMEA lines to connected clients.
 
-    Thread-safe: call send_nmea() from any thread.
+    Thread-safe: call send_nmea() from any thread. Client sockets are
+    non-blocking: output a slow client cannot take yet is kept and retried on
+    the next send, and a client more than MAX_PENDING_BYTES behind is dropped,
+    so one stalled reader never blocks the others.
     """
 
     def __init__(self, host: str = "127.0.0.1", port: int = 2948) -> None:
         self._host = host
         self._port = port
         self._sock: Optional[socket.socket] = None
+        self._selector: Optional[selectors.BaseSelector] = None
         self._clients: List[socket.socket] = []
+        self._pending: Dict[socket.socket, bytes] = {}
         self._lock = threading.Lock()
 
     def start(self) -> bool:
@@ -32,6 +41,8 @@ class NmeaTcpServer:
             self._sock.bind((self._host, self._port))
             self._sock.listen(4)
             self._sock.setblocking(False)
+            self._selector = selectors.DefaultSelector()
+            self._selector.register(self._sock, selectors.EVENT_READ)
             logger.info("NMEA TCP server listening on %s:%s", self._host, self._port)
             return True
         except OSError as e:
@@ -47,6 +58,10 @@ class NmeaTcpServer:
                 except OSError:
                     pass
             self._clients.clear()
+            self._pending.clear()
+        if self._selector:
+            self._selector.close()
+            self._selector = None
         if self._sock:
             try:
                 self._sock.close()
@@ -60,6 +75,9 @@ class NmeaTcpServer:
             return
         try:
             client, _ = self._sock.accept()
+            client.setblocking(False)
+            # Small sentences every tick: do not let Nagle hold them back.
+            client.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
             with self._lock:
                 self._clients.append(client)
             logger.info("NMEA client connected (total %d)", len(self._clients))
@@ -68,26 +86,60 @@ class NmeaTcpServer:
         except OSError as e:
             logger.debug("accept error: %s", e)
 
+    def wait_for_connection(self, timeout: float) -> bool:
+        """
+        Wait up to timeout seconds for a pending connection.
+
+        Uses a selector registered once in start(), so the main loop does not
+        rebuild an fd set on every iteration. Returns True if accept_new()
+        has a connection to take; returns False at once when not started.
+        """
+        if not self._selector:
+            return False
+        return bool(self._selector.select(timeout))
+
     def send_nmea(self, line: str) -> None:
         """
         Send one NMEA line to all connected clients.
 
         line should end with \\r\\n (e.g. from nmea.build_*).
         """
-        if not line:
+        self.send_nmea_batch((line,))
+
+    def send_nmea_batch(self, lines: Iterable[Optional[str]]) -> None:
+        """
+        Send several NMEA lines to all connected clients in one write each.
+
+        Empty or None entries are skipped (e.g. the pair from fix_to_nmea).
+        """
+        data = b"".join(
+            (line if line.endswith("\n") else line.rstrip() + "\r\n").encode(
+                "ascii", errors="replace"
+            )
+            for line in lines
+            if line
+        )
+        if not data:
             return
-        if not line.endswith("\n"):
-            line = line.rstrip() + "\r\n"
-        data = line.encode("ascii", errors="replace")
         with self._lock:
-            dead = []
+            alive = []
             for c in self._clients:
+                buf = self._pending.pop(c, b"") + data
                 try:
-                    c.sendall(data)
+                    sent = c.send(buf)
+                except BlockingIOError:
+                    sent = 0
                 except OSError:
-                    dead.append(c)
-            for c in dead:
-                self._clients.remove(c)
+                    c.close()
+                    continue
+                if sent < len(buf):
+                    if len(buf) - sent > MAX_PENDING_BYTES:
+                        logger.info("NMEA client too slow; disconnecting")
+                        c.close()
+                        continue
+                    self._pending[c] = buf[sent:]
+                alive.append(c)
+            self._clients = alive
 
     def get_socket(self) -> Optional[socket.socket]:
         """Return the server socket for select()."""
@@ -32,6 +32,9 @@ class IMUSource:
         """
         raise NotImplementedError
 
+    def close(self) -> None:
+        """Release any resources held by the source (default: nothing)."""
+
 
 class GPSSource:
     """Source of GPS position and velocity."""
@@ -48,3 +48,6 @@ class CalibratedIMUSource(IMUSource):
             cal.apply_gyro(gyro),
             calibrated_magnetometer,
         )
+
+    def close(self) -> None:
+        self._inner.close()
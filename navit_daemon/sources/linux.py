@@ -31,6 +31,9 @@ class LinuxIMUSource(IMUSource):
             return (accel, gyro, magnetometer)
         return None
 
+    def close(self) -> None:
+        self._reader.close()
+
 
 class LinuxGPSSource(GPSSource):
     """GPS from gpsd."""
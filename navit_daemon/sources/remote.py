@@ -9,35 +9,87 @@ Protocol: one JSON object per line (newline-delimited).
 - Combined: all keys in one object.
 """
 
-import json
 import logging
+import math
+import selectors
 import socket
 import threading
-from typing import Optional, Tuple
+from typing import Optional, Tuple, Union
 
+from navit_daemon.calibration import coerce_triple
 from navit_daemon.gps_reader import GpsFix
+from navit_daemon.jsonutil import loads
 from navit_daemon.sources.base import GPSSource, IMUSource, IMUSample
 
 logger = logging.getLogger(__name__)
 
 
+def _finite_triple(value: object) -> Optional[Tuple[float, float, float]]:
+    """coerce_triple, rejecting NaN/inf (e.g. "nan" strings or 1e400)."""
+    triple = coerce_triple(value)
+    if triple is None or not all(math.isfinite(v) for v in triple):
+        return None
+    return triple
+
+
+def _to_fix(data: dict) -> Optional[GpsFix]:
+    """Build a GpsFix from a message carrying finite lat and lon, else None."""
+    if "lat" not in data or "lon" not in data:
+        return None
+    try:
+        lat = float(data["lat"])
+        lon = float(data["lon"])
+        alt = float(data.get("alt", 0))
+        speed_ms = float(data.get("speed_ms", 0))
+        track = float(data.get("track", 0))
+    except (TypeError, ValueError, OverflowError):
+        return None
+    # The decoders differ on out-of-range numbers (stdlib json turns 1e400
+    # into inf, orjson rejects it) and float() accepts "nan", so check the
+    # values rather than the JSON; the NMEA formatter cannot take them.
+    if not all(math.isfinite(v) for v in (lat, lon, alt, speed_ms, track)):
+        return None
+    time_iso = data.get("time_iso")
+    return GpsFix(
+        lat=lat,
+        lon=lon,
+        alt=alt,
+        speed_ms=speed_ms,
+        track=track,
+        valid=True,
+        mode=2,
+        time_iso=time_iso if isinstance(time_iso, str) else None,
+    )
+
+
+def _close_quietly(sock: Optional[socket.socket]) -> None:
+    if sock:
+        try:
+            sock.close()
+        except OSError:
+            pass
+
+
 class RemoteSource(IMUSource, GPSSource):
     """
     Single source that provides both IMU and GPS from a remote TCP client.
 
     Start the server with start(); then read() and get_fix() return the
-    latest data received from the client.
+    latest data received from the client. The listener thread blocks in a
+    selector until a client connects or stop() wakes it, so it does not poll.
     """
 
     def __init__(self, host: str = "0.0.0.0", port: int = 2949) -> None:
         self._host = host
         self._port = port
         self._lock = threading.Lock()
-        self._last_accel: Optional[Tuple[float, float, float]] = None
-        self._last_gyro: Optional[Tuple[float, float, float]] = None
+        self._last_sample: IMUSample = None
         self._last_magnetometer: Optional[Tuple[float, float, float]] = None
         self._last_fix: Optional[GpsFix] = None
         self._sock: Optional[socket.socket] = None
+        self._client: Optional[socket.socket] = None
+        self._wake_r: Optional[socket.socket] = None
+        self._wake_w: Optional[socket.socket] = None
         self._thread: Optional[threading.Thread] = None
         self._shutdown = False
 
@@ -48,7 +100,8 @@ class RemoteSource(IMUSource, GPSSource):
             self._sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
             self._sock.bind((self._host, self._port))
             self._sock.listen(1)
-            self._sock.settimeout(1.0)
+            self._sock.setblocking(False)
+            self._wake_r, self._wake_w = socket.socketpair()
             self._thread = threading.Thread(target=self._accept_loop, daemon=True)
             self._thread.start()
             logger.info(
@@ -64,114 +117,116 @@ class RemoteSource(IMUSource, GPSSource):
     def stop(self) -> None:
         """Stop the listener and close the socket."""
         self._shutdown = True
-        if self._sock:
+        if self._wake_w:
             try:
-                self._sock.close()
+                self._wake_w.send(b"\0")
+            except OSError:
+                pass
+        client = self._client
+        if client:
+            # Wakes a recv() blocked on the connected client.
+            try:
+                client.shutdown(socket.SHUT_RDWR)
             except OSError:
                 pass
-            self._sock = None
         if self._thread:
             self._thread.join(timeout=2.0)
             self._thread = None
+        for sock in (self._sock, self._wake_r, self._wake_w):
+            _close_quietly(sock)
+        self._sock = self._wake_r = self._wake_w = None
 
-    def _accept_loop(self) -> None:  # noqa: C901
-        while not self._shutdown and self._sock:
-            try:
-                client, addr = self._sock.accept()
-                logger.info("Remote client connected from %s", addr)
+    def _accept_loop(self) -> None:
+        if not self._sock or not self._wake_r:
+            return
+        with selectors.DefaultSelector() as sel:
+            sel.register(self._sock, selectors.EVENT_READ)
+            sel.register(self._wake_r, selectors.EVENT_READ)
+            while not self._shutdown:
+                sel.select()
+                if self._shutdown:
+                    break
                 try:
-                    client.settimeout(5.0)
-                    with client.makefile(mode="r", encoding="utf-8") as f:
-                        for line in f:
-                            if self._shutdown:
-                                break
-                            line = line.strip()
-                            if not line:
-                                continue
-                            self._parse_line(line)
-                except (
-                    ConnectionResetError,
-                    BrokenPipeError,
-                    json.JSONDecodeError,
-                ) as e:
-                    logger.debug("Remote client error: %s", e)
-                finally:
-                    try:
-                        client.close()
-                    except OSError:
-                        pass
-                    logger.info("Remote client disconnected")
-            except socket.timeout:
-                continue
-            except OSError:
-                if not self._shutdown:
-                    logger.debug("Remote accept error")
-                break
-
-    def _parse_line(self, line: str) -> None:
+                    client, addr = self._sock.accept()
+                except BlockingIOError:
+                    continue
+                except OSError:
+                    if not self._shutdown:
+                        logger.debug("Remote accept error")
+                    break
+                self._serve_client(client, addr)
+
+    def _serve_client(self, client: socket.socket, addr: object) -> None:
+        logger.info("Remote client connected from %s", addr)
+        self._client = client
         try:
-            data = json.loads(line)
-        except json.JSONDecodeError:
+            client.settimeout(5.0)
+            self._read_client(client)
+        except (ConnectionResetError, BrokenPipeError, socket.timeout) as e:
+            logger.debug("Remote client error: %s", e)
+        except OSError as e:
+            if not self._shutdown:
+                logger.debug("Remote client error: %s", e)
+        finally:
+            self._client = None
+            _close_quietly(client)
+            logger.info("Remote client disconnected")
+
+    def _read_client(self, client: socket.socket) -> None:
+        """
+        Parse newline-delimited JSON from one client until EOF or shutdown.
+
+        Reads in large chunks and splits complete lines from a bytes buffer,
+        so a burst of samples costs one recv() rather than one per line.
+        Lines are not stripped: the JSON decoder skips surrounding whitespace
+        (including a CR from CRLF clients) and whitespace-only lines are
+        rejected by the decoder like any other invalid line.
+        """
+        pending = b""
+        while not self._shutdown:
+            chunk = client.recv(65536)
+            if not chunk:
+                # A final line without a trailing newline is still a sample.
+                if pending:
+                    self._parse_line(pending)
+                return
+            lines = (pending + chunk).split(b"\n")
+            pending = lines.pop()
+            for line in lines:
+                if line:
+                    self._parse_line(line)
+
+    def _parse_line(self, line: Union[bytes, str]) -> None:
+        try:
+            data = loads(line)
+        except ValueError:
             return
         if not isinstance(data, dict):
             return
+        accel = gyro = None
+        if "accel" in data and "gyro" in data:
+            accel = _finite_triple(data["accel"])
+            gyro = _finite_triple(data["gyro"])
+        magnetometer = _finite_triple(data.get("magnetometer"))
+        fix = _to_fix(data)
         with self._lock:
-            if "accel" in data and "gyro" in data:
-                a = data["accel"]
-                g = data["gyro"]
-                if (
-                    isinstance(a, (list, tuple))
-                    and len(a) >= 3
-                    and isinstance(g, (list, tuple))
-                    and len(g) >= 3
-                ):
-                    try:
-                        self._last_accel = (float(a[0]), float(a[1]), float(a[2]))
-                        self._last_gyro = (float(g[0]), float(g[1]), float(g[2]))
-                    except (TypeError, ValueError):
-                        pass
-            if "magnetometer" in data:
-                m = data["magnetometer"]
-                if isinstance(m, (list, tuple)) and len(m) >= 3:
-                    try:
-                        self._last_magnetometer = (
-                            float(m[0]),
-                            float(m[1]),
-                            float(m[2]),
-                        )
-                    except (TypeError, ValueError):
-                        pass
-            if "lat" in data and "lon" in data:
-                try:
-                    lat = float(data["lat"])
-                    lon = float(data["lon"])
-                    alt = float(data.get("alt", 0))
-                    speed_ms = float(data.get("speed_ms", 0))
-                    track = float(data.get("track", 0))
-                except (TypeError, ValueError):
-                    pass
-                else:
-                    time_iso = data.get("time_iso")
-                    if isinstance(time_iso, str):
-                        pass
-                    else:
-                        time_iso = None
-                    self._last_fix = GpsFix(
-                        lat=lat,
-                        lon=lon,
-                        alt=alt,
-                        speed_ms=speed_ms,
-                        track=track,
-                        valid=True,
-                        mode=2,
-                        time_iso=time_iso,
-                    )
+            if magnetometer is not None:
+                self._last_magnetometer = magnetometer
+            # The sample tuple is rebuilt only when a line changes it, so
+            # read() (called every IMU step) is a single attribute load.
+            if accel is not None and gyro is not None:
+                self._last_sample = (accel, gyro, self._last_magnetometer)
+            elif magnetometer is not None and self._last_sample is not None:
+                self._last_sample = (
+                    self._last_sample[0],
+                    self._last_sample[1],
+                    magnetometer,
+                )
+            if fix is not None:
+                self._last_fix = fix
 
     def read(self) -> IMUSample:
-        with self._lock:
-            if self._last_accel and self._last_gyro:
-                return (self._last_accel, self._last_gyro, self._last_magnetometer)
-        return None
+        return self._last_sample
 
     def get_fix(self) -> Optional[GpsFix]:
         with self._lock:
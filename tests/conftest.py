@@ -0,0 +1,17 @@
+"""
+Shared pytest fixtures.
+"""
+
+import pytest
+
+from navit_daemon import jsonutil
+
+
+@pytest.fixture(params=["stdlib", "orjson"])
+def codec(request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch) -> str:
+    """Force the stdlib or the orjson branch of the JSON line codec."""
+    if request.param == "orjson":
+        monkeypatch.setattr(jsonutil, "_orjson", pytest.importorskip("orjson"))
+    else:
+        monkeypatch.setattr(jsonutil, "_orjson", None)
+    return str(request.param)
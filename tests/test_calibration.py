@@ -2,11 +2,13 @@
 Unit tests for calibration: apply, serialisation, load/save.
 """
 
+import os
 import tempfile
 from pathlib import Path
 
 import pytest
 
+from navit_daemon import calibration
 from navit_daemon.calibration import (
     Calibration,
     load_calibration,
@@ -115,6 +117,46 @@ class TestLoadSaveCalibration:
             assert loaded.accel_offset == cal.accel_offset
             assert loaded.magnetometer_bias == cal.magnetometer_bias
 
+    def test_save_creates_missing_parent_directory(self) -> None:
+        with tempfile.TemporaryDirectory() as d:
+            path = Path(d) / "sub" / "dir" / "cal.json"
+            assert save_calibration(path, Calibration(gyro_bias=(1.0, 2.0, 3.0)))
+            assert load_calibration(path).gyro_bias == (1.0, 2.0, 3.0)
+
+    def test_save_replaces_file_without_leaving_temp(self) -> None:
+        with tempfile.TemporaryDirectory() as d:
+            path = Path(d) / "cal.json"
+            assert save_calibration(path, Calibration(gyro_bias=(1.0, 2.0, 3.0)))
+            assert save_calibration(path, Calibration(gyro_bias=(4.0, 5.0, 6.0)))
+            assert load_calibration(path).gyro_bias == (4.0, 5.0, 6.0)
+            assert [p.name for p in Path(d).iterdir()] == ["cal.json"]
+
+    def test_save_syncs_temp_file_before_replace(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        calls = []
+        real_fsync, real_replace = os.fsync, os.replace
+
+        def fsync(fd: int) -> None:
+            calls.append("fsync")
+            real_fsync(fd)
+
+        def replace(src: Path, dst: Path) -> None:
+            calls.append("replace")
+            real_replace(src, dst)
+
+        monkeypatch.setattr(calibration.os, "fsync", fsync)
+        monkeypatch.setattr(calibration.os, "replace", replace)
+        with tempfile.TemporaryDirectory() as d:
+            assert save_calibration(Path(d) / "cal.json", Calibration())
+        assert calls == ["fsync", "replace"]
+
+    def test_save_to_unwritable_path_returns_false(self) -> None:
+        with tempfile.TemporaryDirectory() as d:
+            blocker = Path(d) / "file"
+            blocker.write_text("")
+            assert save_calibration(blocker / "cal.json", Calibration()) is False
+
     def test_load_invalid_json_returns_default(self) -> None:
         with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
             f.write("not valid json")
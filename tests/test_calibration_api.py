@@ -3,13 +3,21 @@ Unit tests for calibration API: request handling and CalibrationManager.
 """
 
 import json
+import socket
 import tempfile
+import threading
+import time
 from pathlib import Path
 
+import pytest
+
+from navit_daemon import calibration_api
 from navit_daemon.calibration import Calibration
 from navit_daemon.calibration_api import (
     CalibrationManager,
     _handle_request,
+    _serve_client,
+    run_calibration_server,
 )
 
 
@@ -73,6 +81,39 @@ class TestHandleRequestSetCalibration:
         assert resp == {"ok": True}
         assert manager.get_calibration().magnetometer_bias == (1.0, 2.0, 3.0)
 
+    def test_set_calibration_unchanged_skips_save(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        saves = []
+
+        def fake_save(path: Path, calibration: Calibration) -> bool:
+            saves.append(calibration.gyro_bias)
+            return True
+
+        monkeypatch.setattr(calibration_api, "save_calibration", fake_save)
+        manager = CalibrationManager(Calibration())
+        path = Path("cal.json")
+        request = {"set_calibration": {"gyro_bias": [0.5, -0.5, 0.0]}}
+        assert _handle_request(manager, path, request, 100.0) == {"ok": True}
+        assert _handle_request(manager, path, request, 100.0) == {"ok": True}
+        assert saves == [(0.5, -0.5, 0.0)]
+
+    def test_set_calibration_retries_failed_save(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        results = [False, True, True]
+
+        def flaky_save(path: Path, calibration: Calibration) -> bool:
+            return results.pop(0)
+
+        monkeypatch.setattr(calibration_api, "save_calibration", flaky_save)
+        manager = CalibrationManager(Calibration())
+        path = Path("cal.json")
+        request = {"set_calibration": {"gyro_bias": [0.5, -0.5, 0.0]}}
+        for _ in range(3):
+            assert _handle_request(manager, path, request, 100.0) == {"ok": True}
+        assert results == [True]
+
     def test_set_calibration_invalid_gyro_returns_error(self) -> None:
         cal = Calibration()
         manager = CalibrationManager(cal)
@@ -221,6 +262,27 @@ class TestHandleRequestInvalid:
         resp = _handle_request(manager, None, {}, 100.0)
         assert "error" in resp
 
+    def test_get_calibration_takes_precedence(self) -> None:
+        manager = CalibrationManager(Calibration())
+        resp = _handle_request(
+            manager,
+            None,
+            {"set_calibration": {"gyro_bias": [1, 2, 3]}, "get_calibration": True},
+            100.0,
+        )
+        assert resp["calibration_status"] == "idle"
+        assert manager.get_calibration().gyro_bias == (0.0, 0.0, 0.0)
+
+    def test_false_get_calibration_falls_through(self) -> None:
+        manager = CalibrationManager(Calibration())
+        resp = _handle_request(
+            manager,
+            None,
+            {"get_calibration": False, "calibrate_gyro": {}},
+            10.0,
+        )
+        assert resp == {"status": "collecting", "samples_needed": 50}
+
     def test_set_calibration_empty_dict(self) -> None:
         cal = Calibration()
         manager = CalibrationManager(cal)
@@ -245,6 +307,29 @@ class TestCalibrationManagerGyroCollection:
         assert manager.get_calibration().gyro_bias == (0.1, 0.2, 0.3)
         assert manager.get_status()["calibration_status"] == "idle"
 
+    def test_add_gyro_sample_uses_mean_of_samples(self) -> None:
+        cal = Calibration()
+        manager = CalibrationManager(cal)
+        manager.start_gyro_calibration(seconds=0.4, sample_rate_hz=10.0)
+        manager.add_gyro_sample((1.0, -2.0, 0.0))
+        manager.add_gyro_sample((3.0, -4.0, 0.0))
+        assert manager.get_status()["samples_collected"] == 2
+        manager.add_gyro_sample((1.0, -2.0, 4.0))
+        assert manager.add_gyro_sample((3.0, -4.0, 4.0)) is True
+        assert manager.get_calibration().gyro_bias == (2.0, -3.0, 2.0)
+        assert manager.get_status()["samples_collected"] == 0
+
+    def test_reset_clears_calibration_and_collection(self) -> None:
+        manager = CalibrationManager(Calibration(gyro_bias=(1.0, 2.0, 3.0)))
+        manager.start_gyro_calibration(seconds=1.0, sample_rate_hz=10.0)
+        manager.add_gyro_sample((0.1, 0.2, 0.3))
+        manager.reset()
+        status = manager.get_status()
+        assert status["gyro_bias"] == [0.0, 0.0, 0.0]
+        assert status["calibration_status"] == "idle"
+        assert status["samples_collected"] == 0
+        assert manager.add_gyro_sample((0.1, 0.2, 0.3)) is False
+
     def test_add_gyro_sample_saves_to_file_when_set(self) -> None:
         with tempfile.TemporaryDirectory() as d:
             path = Path(d) / "cal.json"
@@ -256,3 +341,117 @@ class TestCalibrationManagerGyroCollection:
             assert path.exists()
             data = json.loads(path.read_text())
             assert data["gyro_bias"] == [0.01, -0.01, 0.02]
+
+
+class TestSetCalibrationNonFinite:
+    """set_calibration rejects NaN/inf values given as strings."""
+
+    def test_nan_string_rejected(self) -> None:
+        manager = CalibrationManager(Calibration())
+        resp = _handle_request(
+            manager,
+            None,
+            {"set_calibration": {"gyro_bias": ["nan", 0, 0]}},
+            100.0,
+        )
+        assert resp == {"error": "gyro_bias must be finite"}
+        assert manager.get_calibration().gyro_bias == (0.0, 0.0, 0.0)
+
+    def test_inf_string_rejected(self) -> None:
+        manager = CalibrationManager(Calibration())
+        resp = _handle_request(
+            manager,
+            None,
+            {"set_calibration": {"magnetometer_bias": [0, "-inf", 0]}},
+            100.0,
+        )
+        assert resp == {"error": "magnetometer_bias must be finite"}
+
+    def test_integer_too_large_for_float_rejected(self) -> None:
+        manager = CalibrationManager(Calibration())
+        resp = _handle_request(
+            manager,
+            None,
+            {"set_calibration": {"accel_offset": [10**400, 0, 0]}},
+            100.0,
+        )
+        assert resp == {"error": "accel_offset must be [x,y,z]"}
+
+
+class TestServeClient:
+    """_serve_client answers every pipelined request line in order."""
+
+    def test_pipelined_requests_answered_in_order(self, codec: str) -> None:
+        manager = CalibrationManager(Calibration())
+        server_end, client_end = socket.socketpair()
+        with server_end, client_end:
+            client_end.sendall(
+                b'{"set_calibration": {"gyro_bias": [1, 2, 3]}}\n'
+                b"not json\r\n"
+                b'\n{"get_calibration": true}\n'
+            )
+            client_end.shutdown(socket.SHUT_WR)
+            _serve_client(server_end, manager, None, 100.0, lambda: False)
+            server_end.shutdown(socket.SHUT_WR)
+            with client_end.makefile("r", encoding="utf-8") as f:
+                responses = [json.loads(line) for line in f]
+        assert len(responses) == 3
+        assert responses[0] == {"ok": True}
+        assert responses[1] == {"error": "invalid JSON"}
+        assert responses[2]["gyro_bias"] == [1.0, 2.0, 3.0]
+
+    def test_request_split_across_reads(self) -> None:
+        manager = CalibrationManager(Calibration())
+        server_end, client_end = socket.socketpair()
+        with server_end, client_end:
+            client_end.sendall(b'{"get_cali')
+            client_end.sendall(b'bration": true}\n')
+            client_end.shutdown(socket.SHUT_WR)
+            _serve_client(server_end, manager, None, 100.0, lambda: False)
+            server_end.shutdown(socket.SHUT_WR)
+            with client_end.makefile("r", encoding="utf-8") as f:
+                responses = [json.loads(line) for line in f]
+        assert [r["calibration_status"] for r in responses] == ["idle"]
+
+    def test_invalid_utf8_returns_error(self, codec: str) -> None:
+        manager = CalibrationManager(Calibration())
+        server_end, client_end = socket.socketpair()
+        with server_end, client_end:
+            client_end.sendall(b"\xff\xfe{}\n")
+            client_end.shutdown(socket.SHUT_WR)
+            _serve_client(server_end, manager, None, 100.0, lambda: False)
+            server_end.shutdown(socket.SHUT_WR)
+            assert json.loads(client_end.recv(4096)) == {"error": "invalid JSON"}
+
+
+class TestRunCalibrationServer:
+    """run_calibration_server accepts clients and exits on shutdown."""
+
+    def test_answers_request_and_stops(self) -> None:
+        with socket.socket() as probe:
+            probe.bind(("127.0.0.1", 0))
+            port = probe.getsockname()[1]
+        stop = threading.Event()
+        thread = threading.Thread(
+            target=run_calibration_server,
+            args=(CalibrationManager(Calibration()), "127.0.0.1", port, None),
+            kwargs={"sample_rate_hz": 100.0, "shutdown": stop.is_set},
+            daemon=True,
+        )
+        thread.start()
+        deadline = time.monotonic() + 2.0
+        while True:
+            try:
+                client = socket.create_connection(("127.0.0.1", port), timeout=2.0)
+                break
+            except ConnectionRefusedError:
+                assert time.monotonic() < deadline
+                time.sleep(0.01)
+        with client:
+            client.sendall(b'{"get_calibration": true}\n')
+            with client.makefile("r", encoding="utf-8") as f:
+                response = json.loads(f.readline())
+        assert response["calibration_status"] == "idle"
+        stop.set()
+        thread.join(timeout=3.0)
+        assert not thread.is_alive()
@@ -0,0 +1,34 @@
+"""
+Unit tests for the JSON line codec (stdlib json and orjson branches).
+"""
+
+import pytest
+
+from navit_daemon.jsonutil import dumps, loads
+
+
+class TestJsonCodec:
+    """loads/dumps behave the same on both branches."""
+
+    def test_roundtrip(self, codec: str) -> None:
+        status = {
+            "gyro_bias": [0.1, 0.2, 0.3],
+            "calibration_status": "idle",
+            "samples_needed": 0,
+        }
+        assert loads(dumps(status)) == status
+
+    def test_dumps_is_compact_bytes(self, codec: str) -> None:
+        assert dumps({"ok": True, "v": [1.5, 2]}) == b'{"ok":true,"v":[1.5,2]}'
+
+    def test_loads_accepts_bytes(self, codec: str) -> None:
+        assert loads(b'{"get_calibration": true}') == {"get_calibration": True}
+
+    def test_invalid_json_raises_value_error(self, codec: str) -> None:
+        with pytest.raises(ValueError):
+            loads('{"get_calibration": ')
+
+    def test_non_finite_literals_rejected(self, codec: str) -> None:
+        for text in ('{"a": NaN}', '{"a": Infinity}', '{"a": -Infinity}'):
+            with pytest.raises(ValueError):
+                loads(text)
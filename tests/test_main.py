@@ -0,0 +1,91 @@
+"""
+Unit tests for the daemon's IMU loop.
+"""
+
+import logging
+import threading
+import time
+from typing import Any, Iterator, List
+
+import pytest
+
+from navit_daemon import main
+from navit_daemon.sources.base import IMUSample, IMUSource
+
+_SAMPLE = ((0.0, 0.0, 9.81), (0.0, 0.0, 0.0), None)
+
+
+class RecordingFusion:
+    """Stand-in for FusionAhrs that records update() calls."""
+
+    def __init__(self) -> None:
+        self.updates: List[Any] = []
+
+    def update(self, accel: Any, gyro: Any, dt: float, magnetometer: Any) -> None:
+        self.updates.append((accel, gyro, dt, magnetometer))
+
+
+class FailingIMUSource(IMUSource):
+    """Returns one sample, then raises."""
+
+    def __init__(self) -> None:
+        self.reads = 0
+
+    def read(self) -> IMUSample:
+        self.reads += 1
+        if self.reads > 1:
+            raise OSError("sensor unplugged")
+        return _SAMPLE
+
+
+class SlowIMUSource(IMUSource):
+    """Reads slower than imu_dt and requests shutdown on the Nth read."""
+
+    def __init__(self, stop_after: int) -> None:
+        self._stop_after = stop_after
+        self.reads = 0
+
+    def read(self) -> IMUSample:
+        self.reads += 1
+        time.sleep(0.01)
+        if self.reads >= self._stop_after:
+            main._shutdown = True
+        return _SAMPLE
+
+
+@pytest.fixture(autouse=True)
+def reset_shutdown(monkeypatch: pytest.MonkeyPatch) -> Iterator[None]:
+    monkeypatch.setattr(main, "_shutdown", False)
+    yield
+
+
+def _run_in_thread(source: IMUSource, fusion: RecordingFusion, dt: float) -> None:
+    thread = threading.Thread(
+        target=main._run_imu_loop, args=(source, fusion, dt), daemon=True
+    )
+    thread.start()
+    thread.join(timeout=2.0)
+    assert not thread.is_alive()
+
+
+class TestRunImuLoop:
+    """_run_imu_loop feeds fusion and stops cleanly."""
+
+    def test_read_error_shuts_daemon_down(
+        self, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        fusion = RecordingFusion()
+        with caplog.at_level(logging.ERROR, logger=main.__name__):
+            _run_in_thread(FailingIMUSource(), fusion, 0.001)
+        assert main._shutdown is True
+        assert fusion.updates == [(_SAMPLE[0], _SAMPLE[1], 0.001, None)]
+        assert "IMU loop failed" in caplog.text
+
+    def test_shutdown_during_catch_up_exits_cleanly(
+        self, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        fusion = RecordingFusion()
+        with caplog.at_level(logging.ERROR, logger=main.__name__):
+            _run_in_thread(SlowIMUSource(stop_after=3), fusion, 0.001)
+        assert len(fusion.updates) == 3
+        assert caplog.records == []
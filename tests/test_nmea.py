@@ -3,9 +3,13 @@ Unit tests for NMEA sentence building: valid, invalid, and edge cases.
 """
 
 import math
+from typing import Any, Dict, Optional, Tuple
+
+import pytest
 
 from navit_daemon.gps_reader import GpsFix
 from navit_daemon.nmea import (
+    _nmea_checksum,
     build_gga,
     build_rmc,
     fix_to_nmea,
@@ -27,6 +31,13 @@ class TestNmeaChecksum:
         assert "*" in s
         assert s.endswith("\r\n")
 
+    def test_checksum_known_sentence(self) -> None:
+        body = "GPGGA,123519,4807.038,N,01131.000,E,1,08,0.9,545.4,M,46.9,M,,"
+        assert _nmea_checksum(body) == "47"
+
+    def test_checksum_matches_sent_bytes_for_non_ascii(self) -> None:
+        assert _nmea_checksum("GP\u00e9") == _nmea_checksum("GP?")
+
 
 class TestBuildGgaValid:
     """Valid input for build_gga."""
@@ -109,48 +120,26 @@ class TestBuildGgaEdgeCases:
 class TestBuildGgaInvalidAndMalformed:
     """Invalid and malformed input for build_gga."""
 
-    def test_lat_beyond_90_clamped_in_formatting(self) -> None:
-        s = build_gga(91.0, 0.0, 0.0)
-        assert "GPGGA" in s
-
-    def test_lat_beyond_minus_90_clamped_in_formatting(self) -> None:
-        s = build_gga(-91.0, 0.0, 0.0)
-        assert "GPGGA" in s
-
-    def test_lon_beyond_180_clamped_in_formatting(self) -> None:
-        s = build_gga(0.0, 181.0, 0.0)
-        assert "GPGGA" in s
-
-    def test_lon_beyond_minus_180_clamped_in_formatting(self) -> None:
-        s = build_gga(0.0, -181.0, 0.0)
-        assert "GPGGA" in s
-
-    def test_negative_fix_quality(self) -> None:
-        s = build_gga(0.0, 0.0, 0.0, fix_quality=-1)
-        assert "GPGGA" in s
-
-    def test_large_fix_quality(self) -> None:
-        s = build_gga(0.0, 0.0, 0.0, fix_quality=10)
-        assert "GPGGA" in s
-
-    def test_negative_num_sats(self) -> None:
-        s = build_gga(0.0, 0.0, 0.0, num_sats=-1)
-        assert "GPGGA" in s
-
-    def test_large_num_sats(self) -> None:
-        s = build_gga(0.0, 0.0, 0.0, num_sats=100)
-        assert "GPGGA" in s
-
-    def test_negative_hdop(self) -> None:
-        s = build_gga(0.0, 0.0, 0.0, hdop=-1.0)
-        assert "GPGGA" in s
-
-    def test_zero_hdop(self) -> None:
-        s = build_gga(0.0, 0.0, 0.0, hdop=0.0)
-        assert "GPGGA" in s
-
-    def test_very_large_altitude(self) -> None:
-        s = build_gga(0.0, 0.0, 100000.0)
+    @pytest.mark.parametrize(
+        "args,kwargs",
+        [
+            ((91.0, 0.0, 0.0), {}),
+            ((-91.0, 0.0, 0.0), {}),
+            ((0.0, 181.0, 0.0), {}),
+            ((0.0, -181.0, 0.0), {}),
+            ((0.0, 0.0, 0.0), {"fix_quality": -1}),
+            ((0.0, 0.0, 0.0), {"fix_quality": 10}),
+            ((0.0, 0.0, 0.0), {"num_sats": -1}),
+            ((0.0, 0.0, 0.0), {"num_sats": 100}),
+            ((0.0, 0.0, 0.0), {"hdop": -1.0}),
+            ((0.0, 0.0, 0.0), {"hdop": 0.0}),
+            ((0.0, 0.0, 100000.0), {}),
+        ],
+    )
+    def test_out_of_range_input_still_builds_gga(
+        self, args: Tuple[float, float, float], kwargs: Dict[str, Any]
+    ) -> None:
+        s = build_gga(*args, **kwargs)
         assert "GPGGA" in s
 
 
@@ -182,38 +171,24 @@ class TestBuildRmcValid:
 class TestBuildRmcInvalidAndMalformed:
     """Invalid and malformed input for build_rmc."""
 
-    def test_date_iso_malformed_returns_default(self) -> None:
-        s = build_rmc(0.0, 0.0, 0.0, 0.0, date_iso="not-a-date")
-        assert "010100" in s
-
-    def test_date_iso_incomplete_returns_default(self) -> None:
-        s = build_rmc(0.0, 0.0, 0.0, 0.0, date_iso="2024-06")
+    @pytest.mark.parametrize("date_iso", ["not-a-date", "2024-06", None, ""])
+    def test_bad_date_iso_returns_default(self, date_iso: Optional[str]) -> None:
+        s = build_rmc(0.0, 0.0, 0.0, 0.0, date_iso=date_iso)
         assert "010100" in s
 
-    def test_date_iso_none_returns_default(self) -> None:
-        s = build_rmc(0.0, 0.0, 0.0, 0.0, date_iso=None)
-        assert "010100" in s
-
-    def test_date_iso_empty_string_returns_default(self) -> None:
-        s = build_rmc(0.0, 0.0, 0.0, 0.0, date_iso="")
-        assert "010100" in s
-
-    def test_negative_speed(self) -> None:
-        s = build_rmc(0.0, 0.0, -5.0, 0.0)
-        assert "GPRMC" in s
-
-    def test_very_large_speed(self) -> None:
-        s = build_rmc(0.0, 0.0, 1000.0, 0.0)
+    @pytest.mark.parametrize(
+        "speed_knots,track_deg", [(-5.0, 0.0), (1000.0, 0.0), (0.0, -1000.0)]
+    )
+    def test_out_of_range_input_still_builds_rmc(
+        self, speed_knots: float, track_deg: float
+    ) -> None:
+        s = build_rmc(0.0, 0.0, speed_knots, track_deg)
         assert "GPRMC" in s
 
     def test_track_very_large_clamped(self) -> None:
         s = build_rmc(0.0, 0.0, 0.0, 1000.0)
         assert "0.0" in s
 
-    def test_track_very_negative_clamped(self) -> None:
-        s = build_rmc(0.0, 0.0, 0.0, -1000.0)
-        assert "GPRMC" in s
-
 
 class TestBuildRmcEdgeCases:
     """Edge cases for build_rmc."""
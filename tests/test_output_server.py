@@ -0,0 +1,86 @@
+"""
+Unit tests for the NMEA TCP output server.
+"""
+
+import socket
+from typing import Iterator
+
+import pytest
+
+from navit_daemon import output_server
+from navit_daemon.output_server import NmeaTcpServer
+
+
+@pytest.fixture
+def server() -> Iterator[NmeaTcpServer]:
+    srv = NmeaTcpServer(port=0)
+    assert srv.start()
+    yield srv
+    srv.stop()
+
+
+def _connect(server: NmeaTcpServer) -> socket.socket:
+    sock = server.get_socket()
+    assert sock is not None
+    client = socket.create_connection(sock.getsockname()[:2])
+    client.settimeout(2.0)
+    assert server.wait_for_connection(2.0)
+    server.accept_new()
+    return client
+
+
+def _recv_exactly(client: socket.socket, size: int) -> bytes:
+    data = b""
+    while len(data) < size:
+        chunk = client.recv(size - len(data))
+        assert chunk
+        data += chunk
+    return data
+
+
+class TestSendNmea:
+    """send_nmea and send_nmea_batch framing."""
+
+    def test_batch_sends_lines_in_order(self, server: NmeaTcpServer) -> None:
+        client = _connect(server)
+        try:
+            server.send_nmea_batch(("$A*00\r\n", None, "", "$B*01"))
+            expected = b"$A*00\r\n$B*01\r\n"
+            assert _recv_exactly(client, len(expected)) == expected
+        finally:
+            client.close()
+
+    def test_wait_for_connection_false_when_stopped(self) -> None:
+        srv = NmeaTcpServer(port=0)
+        assert srv.wait_for_connection(0.0) is False
+
+
+class TestSlowClient:
+    """A client that stops reading is dropped without blocking the others."""
+
+    def test_stalled_client_dropped(
+        self, server: NmeaTcpServer, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(output_server, "MAX_PENDING_BYTES", 4096)
+        reader = _connect(server)
+        stalled = _connect(server)
+        reader.setblocking(False)
+        line = "$" + "X" * 1021 + "\r\n"
+        received = 0
+        try:
+            for _ in range(20000):
+                server.send_nmea(line)
+                try:
+                    while True:
+                        chunk = reader.recv(65536)
+                        assert chunk
+                        received += len(chunk)
+                except BlockingIOError:
+                    pass
+                if len(server._clients) == 1:
+                    break
+            assert len(server._clients) == 1
+            assert received > 0
+        finally:
+            reader.close()
+            stalled.close()
@@ -2,6 +2,9 @@
 Unit tests for remote source JSON parsing: valid, invalid, and edge cases.
 """
 
+import socket
+import time
+
 import pytest
 
 from navit_daemon.sources.remote import RemoteSource
@@ -95,6 +98,12 @@ class TestRemoteSourceParseLineInvalid:
         assert source.read() is None
         assert source.get_fix() is None
 
+    def test_invalid_gyro_keeps_previous_accel(self) -> None:
+        source = RemoteSource(host="127.0.0.1", port=0)
+        source._parse_line('{"accel":[0,0,9.81],"gyro":[0,0,0]}')
+        source._parse_line('{"accel":[1,1,1],"gyro":[0,"x",0]}')
+        assert source.read() == ((0.0, 0.0, 9.81), (0.0, 0.0, 0.0), None)
+
     def test_imu_missing_gyro_not_stored(self) -> None:
         source = RemoteSource(host="127.0.0.1", port=0)
         source._parse_line('{"accel":[0,0,9.81]}')
@@ -219,3 +228,106 @@ class TestRemoteSourceParseLineEdgeCases:
         sample2 = source.read()
         assert sample2 is not None
         assert sample2[2] == (10.0, 20.0, 30.0)
+
+    def test_magnetometer_only_update_refreshes_sample(self) -> None:
+        source = RemoteSource(host="127.0.0.1", port=0)
+        source._parse_line('{"magnetometer":[1,2,3]}')
+        assert source.read() is None
+        source._parse_line('{"accel":[0,0,9.81],"gyro":[0,0,0]}')
+        assert source.read() == ((0.0, 0.0, 9.81), (0.0, 0.0, 0.0), (1.0, 2.0, 3.0))
+        source._parse_line('{"magnetometer":[4,5,6]}')
+        assert source.read() == ((0.0, 0.0, 9.81), (0.0, 0.0, 0.0), (4.0, 5.0, 6.0))
+
+
+class TestRemoteSourceCodec:
+    """Line decoding behaves the same with stdlib json and orjson."""
+
+    def test_bytes_line_parsed(self, codec: str) -> None:
+        source = RemoteSource(host="127.0.0.1", port=0)
+        source._parse_line(b'{"accel":[0,0,9.81],"gyro":[1,2,3]}')
+        assert source.read() == ((0.0, 0.0, 9.81), (1.0, 2.0, 3.0), None)
+
+    def test_nan_literal_rejected(self, codec: str) -> None:
+        source = RemoteSource(host="127.0.0.1", port=0)
+        source._parse_line(b'{"lat":NaN,"lon":0}')
+        assert source.get_fix() is None
+
+    @pytest.mark.parametrize(
+        "line",
+        [
+            b'{"lat":1e400,"lon":0}',
+            b'{"lat":"nan","lon":0}',
+            b'{"lat":0,"lon":0,"alt":"-inf"}',
+            b'{"lat":1' + b"0" * 400 + b',"lon":0}',
+        ],
+    )
+    def test_non_finite_gps_ignored(self, codec: str, line: bytes) -> None:
+        source = RemoteSource(host="127.0.0.1", port=0)
+        source._parse_line(line)
+        assert source.get_fix() is None
+
+    @pytest.mark.parametrize(
+        "line",
+        [
+            b'{"accel":[0,0,1e400],"gyro":[0,0,0]}',
+            b'{"accel":[0,0,9.81],"gyro":["nan",0,0]}',
+        ],
+    )
+    def test_non_finite_imu_ignored(self, codec: str, line: bytes) -> None:
+        source = RemoteSource(host="127.0.0.1", port=0)
+        source._parse_line(line)
+        assert source.read() is None
+
+    def test_non_finite_magnetometer_ignored(self, codec: str) -> None:
+        source = RemoteSource(host="127.0.0.1", port=0)
+        source._parse_line(
+            b'{"accel":[0,0,9.81],"gyro":[0,0,0],"magnetometer":["inf",0,0]}'
+        )
+        assert source.read() == ((0.0, 0.0, 9.81), (0.0, 0.0, 0.0), None)
+
+    def test_invalid_utf8_ignored(self, codec: str) -> None:
+        source = RemoteSource(host="127.0.0.1", port=0)
+        source._parse_line(b'{"lat":1,"lon":2,"time_iso":"\xff"}')
+        assert source.get_fix() is None
+
+
+class TestRemoteSourceReadClient:
+    """_read_client splits the byte stream into lines across recv() calls."""
+
+    def test_line_split_across_reads_and_final_line(self) -> None:
+        source = RemoteSource(host="127.0.0.1", port=0)
+        server_end, client_end = socket.socketpair()
+        try:
+            client_end.sendall(b'{"accel":[0,0,9.81],"gyro":[0,0,0]}\r\n\n{"lat":1,')
+            client_end.sendall(b'"lon":2}\n{"lat":3,"lon":4}')
+            client_end.shutdown(socket.SHUT_WR)
+            source._read_client(server_end)
+        finally:
+            server_end.close()
+            client_end.close()
+        assert source.read() == ((0.0, 0.0, 9.81), (0.0, 0.0, 0.0), None)
+        fix = source.get_fix()
+        assert fix is not None
+        assert (fix.lat, fix.lon) == (3.0, 4.0)
+
+
+class TestRemoteSourceServer:
+    """Listener thread receives samples and stops without polling delays."""
+
+    def test_receives_sample_and_stops_promptly(self) -> None:
+        source = RemoteSource(host="127.0.0.1", port=0)
+        assert source.start()
+        assert source._sock is not None
+        client = socket.create_connection(source._sock.getsockname()[:2])
+        try:
+            client.sendall(b'{"lat":1,"lon":2}\n')
+            deadline = time.monotonic() + 2.0
+            while source.get_fix() is None and time.monotonic() < deadline:
+                time.sleep(0.01)
+            assert source.get_fix() is not None
+            started = time.monotonic()
+            source.stop()
+            assert time.monotonic() - started < 0.5
+        finally:
+            client.close()
+            source.stop()